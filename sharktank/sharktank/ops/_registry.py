@@ -117,10 +117,11 @@ class SignatureDispatcher:
         type_spec = tuple(type(t) for t in tensors)
         found_targets = self._target_cache.get(type_spec)
         if found_targets is None:
-            # Slow-path try to find it.
-            found_targets = self._match_targets(type_spec)
+            # Slow-path try to find it. Cache in priority order so that the
+            # fast-path is a single lookup.
+            found_targets = tuple(reversed(self._match_targets(type_spec)))
             self._target_cache[type_spec] = found_targets
-        return reversed(found_targets)
+        return found_targets
 
     def fail(self, tensors: tuple[Any, ...]):
         spec = [type(t) for t in tensors]
@@ -49,7 +49,7 @@ from .signatures import *
 
 @matmul.override(Tensor, QuantizedTensor)
 def matmul_generic_tensor_block_scaled(
-    lhs, rhs: QuantizedTensor, *, transpose_rhs: bool
+    lhs, rhs: QuantizedTensor, *, transpose_rhs: bool, out
 ):
     """Generic fallback kernel for block scaled layouts.
 
@@ -63,6 +63,8 @@ def matmul_generic_tensor_block_scaled(
     layout = rhs.layout_type
     if layout is not BlockScaledLayout:
         return NotImplemented
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for quantized kernels")
     rhs_unpacked = rhs.unpack()
     assert rhs_unpacked.m is None, "NYI: Q8 block scaled with offset"
     return mmt_block_scaled_q8(lhs, rhs_unpacked.d, rhs_unpacked.qs)
@@ -70,7 +72,7 @@ def matmul_generic_tensor_block_scaled(
 
 @matmul.override(Tensor, QuantizedTensor)
 def matmul_generic_tensor_block_scaled_i4(
-    lhs, rhs: QuantizedTensor, *, transpose_rhs: bool
+    lhs, rhs: QuantizedTensor, *, transpose_rhs: bool, out
 ):
     """Generic fallback kernel for an unsigned, block scaled Q4."""
     lhs = unbox_tensor(lhs)
@@ -79,6 +81,8 @@ def matmul_generic_tensor_block_scaled_i4(
     layout = rhs.layout_type
     if layout is not BlockScaledI4Layout:
         return NotImplemented
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for quantized kernels")
     rhs_unpacked = rhs.unpack()
     assert rhs_unpacked.m is not None, "NYI: Q4 without offset not"
     assert not rhs_unpacked.signed, "NYI: Q4 signed"
@@ -89,7 +93,7 @@ def matmul_generic_tensor_block_scaled_i4(
 
 @matmul.override(Tensor, QuantizedTensor)
 def matmul_generic_tensor_super_block_offset_scaled_4_6_i4(
-    lhs, rhs: QuantizedTensor, *, transpose_rhs: bool
+    lhs, rhs: QuantizedTensor, *, transpose_rhs: bool, out
 ):
     lhs = unbox_tensor(lhs)
     if not transpose_rhs:
@@ -97,6 +101,8 @@ def matmul_generic_tensor_super_block_offset_scaled_4_6_i4(
     layout = rhs.layout_type
     if layout is not SuperBlockOffsetScaled_4_6_Layout:
         return NotImplemented
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for quantized kernels")
     rhs_unpacked = rhs.unpack()
     sb_scales_hi, sb_scales_low = rhs_unpacked.sb_scales_bit_packed
     sb_mins_hi, sb_mins_low = rhs_unpacked.sb_mins_bit_packed
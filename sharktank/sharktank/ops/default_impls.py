@@ -81,11 +81,60 @@ def embedding_lookup_Tensor_QuantizedTensor(
     return F.embedding(unbox_tensor(input), dequant)
 
 
+@embedding_lookup.override(Tensor, QuantizedTensor)
+def embedding_lookup_Tensor_QuantizedTensor_gather(
+    input, embedding_matrix: QuantizedTensor, dtype: dtype
+):
+    """Gathers the selected rows in their quantized form and only dequantizes
+    those rows.
+
+    This applies to layouts whose planes are either whole tensor scalars or
+    are indexed by row on their leading dimension (i.e. per-row and block
+    scaled layouts).
+    """
+    layout = embedding_matrix.unpack()
+    if len(layout.shape) != 2:
+        return NotImplemented
+    row_count, row_size = layout.shape
+    input = unbox_tensor(input)
+    indices = input.flatten()
+    planes = {}
+    for name, plane in layout.planes.items():
+        if plane.numel() == 1:
+            planes[name] = plane
+        elif len(plane.shape) >= 2 and plane.shape[0] == row_count:
+            planes[name] = plane.index_select(0, indices)
+        else:
+            return NotImplemented
+    rows = type(layout).create([indices.shape[0], row_size], layout.metadata, planes)
+    return rows.dequant(dtype=dtype).reshape(*input.shape, row_size)
+
+
 @equal.override(Tensor, Tensor)
 def equal_default(a, b) -> bool:
     return torch.equal(unbox_tensor(a), unbox_tensor(b))
 
 
+# Fused top-k softmax
+@fused_topk_softmax.override(Tensor)
+def fused_topk_softmax_default(
+    logits, k: int, *, renormalize: bool
+) -> tuple[Tensor, Tensor]:
+    logits = unbox_tensor(logits)
+    accum_dtype = torch.promote_types(logits.dtype, torch.float32)
+    top_logits, indices = torch.topk(logits, k, dim=-1)
+    if renormalize:
+        weights = F.softmax(top_logits, dim=-1, dtype=accum_dtype)
+    else:
+        # Subtracting the max bounds the exponents to <= 0, which is safe to
+        # evaluate in the logits dtype. Only the partition sum and the k
+        # selected weights are computed in the accumulator dtype.
+        max_logits = top_logits[..., :1]
+        z = torch.exp(logits - max_logits).sum(-1, keepdim=True, dtype=accum_dtype)
+        weights = torch.exp((top_logits - max_logits).to(accum_dtype)) / z
+    return weights.to(logits.dtype), indices
+
+
 # Group norm.
 @group_norm_affine.override(Tensor, Tensor, Tensor)
 def group_norm_affine_default(input, weight, bias, *, num_groups, eps):
@@ -145,32 +194,46 @@ linear.override(Tensor, Tensor, Tensor, auto_dequant=True)(linear_default)
 
 # Matmul
 @matmul.override(Tensor, Tensor, auto_dequant=True)
-def matmul_default(lhs, rhs, *, transpose_rhs: bool) -> Tensor:
+def matmul_default(lhs, rhs, *, transpose_rhs: bool, out) -> Tensor:
     lhs = unbox_tensor(lhs)
     rhs = unbox_tensor(rhs)
     if transpose_rhs:
         rhs = rhs.T
-    return torch.matmul(lhs, rhs.to(lhs.dtype))
+    if out is not None:
+        out = unbox_tensor(out)
+    return torch.matmul(lhs, rhs.to(lhs.dtype), out=out)
 
 
 # RMS norm
-@rms_norm.override(Tensor, Tensor)
-def rms_norm_default(x, weight, *, epsilon: float) -> Tensor:
+def rms_norm_default(
+    x, weight, *, epsilon: float, residual
+) -> Tensor | tuple[Tensor, Tensor]:
     x = unbox_tensor(x)
     weight = unbox_tensor(weight)
+    if residual is not None:
+        x = x + unbox_tensor(residual)
     variance = x.pow(2).mean(-1, keepdim=True)
     output = x * torch.rsqrt(variance + epsilon)
     output = output * weight
+    if residual is not None:
+        return output, x
     return output
 
 
-@rms_norm.override(Tensor, QuantizedTensor)
+rms_norm.override(Tensor, Tensor)(rms_norm_default)
+rms_norm.override(Tensor, Tensor, Tensor)(rms_norm_default)
+
+
 def rms_norm_Tensor_QuantizedTensor(
-    x, weight: PrimitiveTensor, *, epsilon: float
-) -> Tensor:
+    x, weight: PrimitiveTensor, *, epsilon: float, residual
+) -> Tensor | tuple[Tensor, Tensor]:
     x = unbox_tensor(x)
     weight = weight.unpack().dequant(x.dtype)
-    return rms_norm_default(x, weight, epsilon=epsilon)
+    return rms_norm_default(x, weight, epsilon=epsilon, residual=residual)
+
+
+rms_norm.override(Tensor, QuantizedTensor)(rms_norm_Tensor_QuantizedTensor)
+rms_norm.override(Tensor, QuantizedTensor, Tensor)(rms_norm_Tensor_QuantizedTensor)
 
 
 @permute.override(Tensor)
@@ -370,8 +370,10 @@ for types in itertools.product([Tensor, ShardedTensor], repeat=2):
 
 @matmul.override(ReplicatedTensor, SplitPrimitiveTensor)
 def matmul_replicated_lhs_split_rhs(
-    lhs: ReplicatedTensor, rhs: SplitPrimitiveTensor, *, transpose_rhs: bool
+    lhs: ReplicatedTensor, rhs: SplitPrimitiveTensor, *, transpose_rhs: bool, out
 ) -> SplitPrimitiveTensor | UnreducedTensor:
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for sharded tensors")
     assert lhs.shard_count == rhs.shard_count
 
     if transpose_rhs:
@@ -394,8 +396,10 @@ def matmul_replicated_lhs_split_rhs(
 
 @matmul.override(SplitPrimitiveTensor, Tensor)
 def matmul_split_lhs(
-    lhs: SplitPrimitiveTensor, rhs, *, transpose_rhs: bool
+    lhs: SplitPrimitiveTensor, rhs, *, transpose_rhs: bool, out
 ) -> SplitPrimitiveTensor:
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for sharded tensors")
     lhs_reduction_dim = len(lhs.shape) - 1
     assert lhs_reduction_dim != lhs.shard_dim
     shards = [
@@ -406,8 +410,10 @@ def matmul_split_lhs(
 
 @matmul.override(Tensor, SplitPrimitiveTensor)
 def matmul_split_rhs(
-    lhs, rhs: SplitPrimitiveTensor, *, transpose_rhs: bool
+    lhs, rhs: SplitPrimitiveTensor, *, transpose_rhs: bool, out
 ) -> SplitPrimitiveTensor:
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for sharded tensors")
     # When multiplying (unsharded, split), the rhs must be split by column.
     # In a transposed configuration, this is axis 0, otherwise 1.
     # This will result in a ShardedTensor, split by column.
@@ -431,8 +437,10 @@ def matmul_split_rhs(
 
 @matmul.override(SplitPrimitiveTensor, ReplicatedTensor)
 def matmul_split_lhs_replicated_rhs(
-    lhs: SplitPrimitiveTensor, rhs: ReplicatedTensor, *, transpose_rhs: bool
+    lhs: SplitPrimitiveTensor, rhs: ReplicatedTensor, *, transpose_rhs: bool, out
 ) -> SplitPrimitiveTensor:
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for sharded tensors")
     lhs_reduction_dim = len(lhs.shape) - 1
     assert lhs_reduction_dim != lhs.shard_dim
     if transpose_rhs:
@@ -446,8 +454,10 @@ def matmul_split_lhs_replicated_rhs(
 
 @matmul.override(SplitPrimitiveTensor, SplitPrimitiveTensor)
 def matmul_split(
-    lhs: SplitPrimitiveTensor, rhs: SplitPrimitiveTensor, *, transpose_rhs: bool
+    lhs: SplitPrimitiveTensor, rhs: SplitPrimitiveTensor, *, transpose_rhs: bool, out
 ) -> UnreducedTensor | SplitPrimitiveTensor:
+    if out is not None:
+        raise NotImplementedError("matmul: out= is not supported for sharded tensors")
     if lhs.shard_count != rhs.shard_count:
         raise ValueError(
             f"Cannot matmul split tensors of different shard_count: "
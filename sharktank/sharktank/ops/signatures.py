@@ -21,6 +21,7 @@ __all__ = [
     "elementwise",
     "embedding_lookup",
     "equal",
+    "fused_topk_softmax",
     "group_norm_affine",
     "layer_norm",
     "interpolate",
@@ -190,6 +191,51 @@ def _equal_trampoline(d: SignatureDispatcher, a: AnyTensor, b: AnyTensor):
         d.fail(tensors)
 
 
+@overridable
+def fused_topk_softmax(
+    logits: AnyTensor, k: int, renormalize: bool = True
+) -> tuple[AnyTensor, AnyTensor]:
+    """Selects the `k` largest logits along the last dimension and returns
+    their softmax weights together with their indices.
+
+    This is the routing computation of a mixture of experts layer. It is a
+    separate op so that backends can substitute a single fused top-k/softmax
+    kernel for what would otherwise be two ops that the compiler must fuse.
+
+    If `renormalize` is True, the weights are equivalent to a softmax over all
+    logits, followed by a top-k selection and a renormalization of the
+    selected weights to sum to 1. Since softmax is monotonic and the
+    renormalization cancels the partition function, only the `k` selected
+    logits need to be exponentiated. Otherwise, the weights are the unmodified
+    softmax probabilities of the selected logits.
+
+    The softmax is accumulated in at least float32 precision regardless of the
+    dtype of `logits`, but the weights are returned in the dtype of `logits`.
+    This keeps reduced precision (i.e. bf16) routers from having to upcast
+    their full logits.
+
+    Returns a `(weights, indices)` tuple, each of shape `[..., k]`.
+    """
+    raise NotImplementedError
+
+
+@fused_topk_softmax.trampoline
+def _fused_topk_softmax_trampoline(
+    d: SignatureDispatcher, logits: AnyTensor, k: int, renormalize: bool = True
+):
+    if not 1 <= k <= logits.shape[-1]:
+        raise ValueError(
+            f"fused_topk_softmax: k must be in [1, {logits.shape[-1]}] but is {k}"
+        )
+    tensors = (logits,)
+    for override in d.find_overrides(tensors):
+        result = override(logits, k, renormalize=renormalize)
+        if result is not NotImplemented:
+            return override, result
+    else:
+        d.fail(tensors)
+
+
 @overridable
 def group_norm_affine(
     input: AnyTensor, weight: AnyTensor, bias: AnyTensor, *, num_groups: int, eps: float
@@ -332,7 +378,13 @@ def _linear_trampoline(
 
 
 @overridable
-def matmul(lhs: AnyTensor, rhs: AnyTensor, *, transpose_rhs: bool = False):
+def matmul(
+    lhs: AnyTensor,
+    rhs: AnyTensor,
+    *,
+    transpose_rhs: bool = False,
+    out: Optional[AnyTensor] = None,
+):
     """Performs a matmul where the RHS may be an InferenceTensor.
 
     Unlike torch.matmul, this variant is optimized for emission of a fused
@@ -346,18 +398,27 @@ def matmul(lhs: AnyTensor, rhs: AnyTensor, *, transpose_rhs: bool = False):
     rhs: Right hand side tensor. Must be 2d or a scalar.
     transpose_rhs: Whether the right hand side should be transposed prior
         to matmul.
+    out: Optional destination tensor for the result. Passing a preallocated
+        buffer lets callers reuse it across repeated matmuls. The custom
+        quantized kernels and sharded tensors cannot write into a
+        destination and raise if `out` is given.
     """
     raise NotImplementedError
 
 
 @matmul.trampoline
 def _matmul_trampoline(
-    d: SignatureDispatcher, lhs, rhs, *, transpose_rhs: bool = False
+    d: SignatureDispatcher,
+    lhs,
+    rhs,
+    *,
+    transpose_rhs: bool = False,
+    out: Optional[AnyTensor] = None,
 ):
     tensors = (lhs, rhs)
     assert isinstance(rhs, numbers.Number) or len(rhs.shape) == 2
     for override in d.find_overrides(tensors):
-        result = override(lhs, rhs, transpose_rhs=transpose_rhs)
+        result = override(lhs, rhs, transpose_rhs=transpose_rhs, out=out)
         if result is not NotImplemented:
             return override, result
     else:
@@ -384,18 +445,36 @@ def _permute_trampoline(d: SignatureDispatcher, tensor: AnyTensor, dims: List[in
 
 
 @overridable
-def rms_norm(x: AnyTensor, weight: AnyTensor, *, epsilon: float) -> AnyTensor:
-    """Computes the full, unbiased RMS normalization of an input."""
+def rms_norm(
+    x: AnyTensor,
+    weight: AnyTensor,
+    *,
+    epsilon: float,
+    residual: Optional[AnyTensor] = None,
+) -> AnyTensor | tuple[AnyTensor, AnyTensor]:
+    """Computes the full, unbiased RMS normalization of an input.
+
+    If a `residual` is given, the normalization is applied to `x + residual`
+    and a `(normalized, x + residual)` tuple is returned. The sum is the
+    updated residual stream that callers need anyway, so returning it lets
+    implementations fuse the residual add into the (memory bound)
+    normalization in a single pass.
+    """
     raise NotImplementedError
 
 
 @rms_norm.trampoline
 def _rms_norm_trampoline(
-    d: SignatureDispatcher, x: AnyTensor, weight: AnyTensor, *, epsilon: float
+    d: SignatureDispatcher,
+    x: AnyTensor,
+    weight: AnyTensor,
+    *,
+    epsilon: float,
+    residual: Optional[AnyTensor] = None,
 ):
-    tensors = (x, weight)
+    tensors = (x, weight) if residual is None else (x, weight, residual)
     for override in d.find_overrides(tensors):
-        result = override(x, weight, epsilon=epsilon)
+        result = override(x, weight, epsilon=epsilon, residual=residual)
         if result is not NotImplemented:
             return override, result
     else:
@@ -63,6 +63,9 @@ class EqualTest(unittest.TestCase):
 
 
 class EmbeddingLookupTest(unittest.TestCase):
+    def tearDown(self):
+        ops._registry._test_enable_last_op_dispatch(False)
+
     def testTorchImplNoCast(self):
         t1 = torch.tensor([[1, 2, 4, 5], [4, 3, 2, 9]])
         t2 = torch.rand(10, 3, dtype=torch.float32)
@@ -85,9 +88,108 @@ class EmbeddingLookupTest(unittest.TestCase):
         expected = F.embedding(t1, t2.to(torch.float32))
         torch.testing.assert_close(result, expected)
 
-    def testQuantizedTensorRhs(self):
-        # TODO: Implement me. Quantized embedding lookup NYI completely.
-        ...
+    def testQuantizedTensorRhs_TensorScaledLayout(self):
+        ops._registry._test_enable_last_op_dispatch(True)
+        t1 = torch.tensor([[1, 2, 4, 5], [4, 3, 2, 9]])
+        d = torch.tensor(0.25, dtype=torch.float32)
+        qs = (torch.rand(10, 3) * 255.0 - 128.0).to(torch.int8)
+        layout = TensorScaledLayout(shape=[10, 3], d=d, qs=qs)
+        t2_pqt = PlanarQuantizedTensor(shape=[10, 3], layout=layout)
+        result = ops.embedding_lookup(t1, t2_pqt, torch.float32)
+        expected = F.embedding(t1, layout.dequant(torch.float32))
+        torch.testing.assert_close(result, expected)
+        self.assertIs(
+            ops._registry._test_get_last_op_dispatch(),
+            ops.default_impls.embedding_lookup_Tensor_QuantizedTensor_gather,
+        )
+
+    def testQuantizedTensorRhs_BlockScaledI4Layout(self):
+        t1 = torch.tensor([[1, 2, 4, 5], [4, 3, 2, 9]])
+        d = torch.rand([10, 2, 1], dtype=torch.float32)
+        qs = (torch.rand([10, 2, 16]) * 255.0).to(torch.uint8)
+        m = torch.rand([10, 2, 1], dtype=torch.float32)
+        layout = BlockScaledI4Layout([10, 64], d, qs, m=m, signed=False)
+        t2_pqt = PlanarQuantizedTensor(shape=[10, 64], layout=layout)
+        result = ops.embedding_lookup(t1, t2_pqt, torch.float32)
+        expected = F.embedding(t1, layout.dequant(torch.float32))
+        torch.testing.assert_close(result, expected)
+
+
+class FusedTopKSoftmaxTest(unittest.TestCase):
+    def testTorchImpl(self):
+        logits = torch.rand(32, 8, dtype=torch.float32)
+        weights, indices = ops.fused_topk_softmax(logits, 2)
+        expected_weights, expected_indices = torch.topk(
+            F.softmax(logits, dim=-1), 2, dim=-1
+        )
+        expected_weights /= expected_weights.sum(dim=-1, keepdim=True)
+        torch.testing.assert_close(weights, expected_weights)
+        assert torch.equal(indices, expected_indices)
+
+    def testTorchImplNoRenormalize(self):
+        logits = torch.rand(32, 8, dtype=torch.float32)
+        weights, indices = ops.fused_topk_softmax(logits, 2, renormalize=False)
+        expected_weights, expected_indices = torch.topk(
+            F.softmax(logits, dim=-1), 2, dim=-1
+        )
+        torch.testing.assert_close(weights, expected_weights)
+        assert torch.equal(indices, expected_indices)
+
+    def testTorchImplBf16(self):
+        # Distinct logits so that the selection is free of ties.
+        logits = torch.stack([torch.randperm(8) for _ in range(32)]) / 4.0
+        logits = logits.to(torch.bfloat16)
+        weights, indices = ops.fused_topk_softmax(logits, 2)
+        expected_weights, expected_indices = torch.topk(
+            F.softmax(logits, dim=-1, dtype=torch.float32), 2, dim=-1
+        )
+        expected_weights /= expected_weights.sum(dim=-1, keepdim=True)
+        self.assertEqual(weights.dtype, torch.bfloat16)
+        torch.testing.assert_close(weights, expected_weights.to(torch.bfloat16))
+        assert torch.equal(indices, expected_indices)
+
+    def testTorchImplFloat64(self):
+        logits = torch.rand(32, 8, dtype=torch.float64)
+        for renormalize in [True, False]:
+            weights, indices = ops.fused_topk_softmax(
+                logits, 2, renormalize=renormalize
+            )
+            expected_weights, expected_indices = torch.topk(
+                F.softmax(logits, dim=-1), 2, dim=-1
+            )
+            if renormalize:
+                expected_weights /= expected_weights.sum(dim=-1, keepdim=True)
+            self.assertEqual(weights.dtype, torch.float64)
+            torch.testing.assert_close(weights, expected_weights)
+            assert torch.equal(indices, expected_indices)
+
+    def testTorchImplNoRenormalizeBf16(self):
+        # Distinct logits so that the selection is free of ties.
+        logits = torch.stack([torch.randperm(8) for _ in range(32)]) / 4.0
+        logits = logits.to(torch.bfloat16)
+        weights, indices = ops.fused_topk_softmax(logits, 2, renormalize=False)
+        expected_weights, expected_indices = torch.topk(
+            F.softmax(logits, dim=-1, dtype=torch.float32), 2, dim=-1
+        )
+        self.assertEqual(weights.dtype, torch.bfloat16)
+        torch.testing.assert_close(weights, expected_weights.to(torch.bfloat16))
+        assert torch.equal(indices, expected_indices)
+
+    def testInvalidK(self):
+        logits = torch.rand(32, 8, dtype=torch.float32)
+        for k in [0, 9]:
+            for renormalize in [True, False]:
+                with self.assertRaisesRegex(ValueError, "k must be in"):
+                    ops.fused_topk_softmax(logits, k, renormalize=renormalize)
+
+    def testPrimitiveTensor(self):
+        logits = torch.rand(4, 16, 8, dtype=torch.float32)
+        weights, indices = ops.fused_topk_softmax(
+            DefaultPrimitiveTensor(data=logits), 3
+        )
+        expected_weights, expected_indices = ops.fused_topk_softmax(logits, 3)
+        torch.testing.assert_close(weights, expected_weights)
+        assert torch.equal(indices, expected_indices)
 
 
 class MatmulTest(unittest.TestCase):
@@ -103,6 +205,15 @@ class MatmulTest(unittest.TestCase):
         ):
             ops.matmul(1, 2)
 
+    def testTorchImplOut(self):
+        t1 = torch.rand(32, 16, dtype=torch.float32)
+        t2 = torch.rand(48, 16, dtype=torch.float16)
+        out = torch.empty(32, 48, dtype=torch.float32)
+        result = ops.matmul(t1, t2, transpose_rhs=True, out=out)
+        expected = torch.matmul(t1, t2.T.to(torch.float32))
+        self.assertIs(result, out)
+        torch.testing.assert_close(result, expected)
+
     @unittest.skip("https://github.com/nod-ai/sharktank/issues/44")
     def testTorchImplTransposedRHS(self):
         ops._registry._test_enable_last_op_dispatch(True)
@@ -181,6 +292,17 @@ class MatmulTest(unittest.TestCase):
             ops.custom_impls.matmul_generic_tensor_block_scaled_i4,
         )
 
+    def testTorchImplTransposedQuantizedRHSOutNotSupported(self):
+        a = torch.rand([4, 16, 64], dtype=torch.float32)
+        d = torch.rand([32, 2, 1], dtype=torch.float32)
+        qs = (torch.rand([32, 2, 32]) * 32.0).to(torch.int8)
+        rhs_pqt = PlanarQuantizedTensor(
+            shape=[32, 64], layout=BlockScaledLayout([32, 64], d, qs)
+        )
+        out = torch.empty(4, 16, 32, dtype=torch.float32)
+        with self.assertRaisesRegex(NotImplementedError, "out="):
+            ops.matmul(a, rhs_pqt, transpose_rhs=True, out=out)
+
     # TODO: mmt_super_block_scaled_offset_q4_unsigned
 
 
@@ -225,6 +347,27 @@ class RmsNormTest(unittest.TestCase):
         actual = self._ref(t1, t2, epsilon=1e-10)
         torch.testing.assert_close(actual, result)
 
+    def testTorchResidualImpl(self):
+        t1 = torch.rand(16, 128, dtype=torch.float32)
+        t2 = torch.rand(16, 128, dtype=torch.float32)
+        t3 = torch.rand(16, 128, dtype=torch.float32)
+        result, residual = ops.rms_norm(t1, t2, epsilon=1e-10, residual=t3)
+        actual = self._ref(t1 + t3, t2, epsilon=1e-10)
+        torch.testing.assert_close(actual, result)
+        torch.testing.assert_close(t1 + t3, residual)
+
+    def testTorchQuantizedWeightResidualImpl(self):
+        t1 = torch.rand(16, 128, dtype=torch.float32)
+        t3 = torch.rand(16, 128, dtype=torch.float32)
+        d = torch.tensor(0.125, dtype=torch.float32)
+        qs = (torch.rand(128) * 127.0).to(torch.int8)
+        layout = TensorScaledLayout(shape=[128], d=d, qs=qs)
+        t2_pqt = PlanarQuantizedTensor(shape=[128], layout=layout)
+        result, residual = ops.rms_norm(t1, t2_pqt, epsilon=1e-10, residual=t3)
+        actual = self._ref(t1 + t3, layout.dequant(torch.float32), epsilon=1e-10)
+        torch.testing.assert_close(actual, result)
+        torch.testing.assert_close(t1 + t3, residual)
+
     # TODO: Quantized tensor
 
 
@@ -469,6 +469,14 @@ class MatmulTest(unittest.TestCase):
         unsharded_result = ops.sharded_cat(sharded_result)
         torch.testing.assert_close(unsharded_result, expected_result)
 
+    def testTorchRHSColumnShardedOutNotSupported(self):
+        t1 = torch.rand(4, 32, 16, dtype=torch.float32)
+        t2 = torch.rand(16, 48, dtype=torch.float16)
+        t2_sharded = SplitPrimitiveTensor(shard_dim=1, ts=t2.split(4, dim=1))
+        out = torch.empty(4, 32, 48, dtype=torch.float32)
+        with self.assertRaisesRegex(NotImplementedError, "out="):
+            ops.matmul(t1, t2_sharded, out=out)
+
     def testReplicatedLhsShardedParallelDimRhs(self):
         a = torch.rand(2, 5, 3, dtype=torch.float32)
         b = torch.rand(3, 6, dtype=torch.float32)